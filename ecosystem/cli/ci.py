@@ -19,20 +19,25 @@ class CliCI:
     Ex: `python manager.py ci parser_issue --body="<SOME_MARKDOWN>"`
     """
 
-    @staticmethod
-    def add_member_from_issue(body: str, *, resources_dir: str | None = None) -> None:
+    def __init__(self, resources_dir: str | None = None):
+        """CliCI class.
+
+        Args:
+            resources_dir: (For testing) Path to the resources directory
+        """
+        self.resources_dir = Path(resources_dir or (Path.cwd() / "ecosystem/resources"))
+        self.dao = DAO(path=self.resources_dir)
+
+    def add_member_from_issue(self, body: str) -> None:
         """Parse an issue created from the issue template and add the member to the database
 
         Args:
             body: body of the created issue
-            resources_dir: (For testing) Path to the working directory
 
         Returns:
             None (side effect is updating database and writing actions output)
         """
 
-        resources_dir = Path(resources_dir or (Path.cwd() / "ecosystem/resources"))
-
         parsed_result = parse_submission_issue(body)
-        DAO(path=resources_dir).write(parsed_result)
+        self.dao.write(parsed_result)
         set_actions_output([("SUBMISSION_NAME", parsed_result.name)])
@@ -1,16 +1,28 @@
 """CliMembers class for controlling all CLI functions."""
 
+import hashlib
 import json
 import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from ecosystem.daos import DAO
 from ecosystem.models.repository import Repository
 from ecosystem.utils import logger
 
+GRAPHQL_BATCH_SIZE = 100
+MAX_WORKERS = 16
+# ETags of REST responses from previous runs, kept out of the member data
+ETAGS_FILE = ".etags.json"
+RATE_LIMIT_ATTEMPTS = 3
+
 
 class CliMembers:
     """CliMembers class.
@@ -28,6 +40,23 @@ class CliMembers:
         self.resources_dir = "{}/ecosystem/resources".format(self.current_dir)
         self.dao = DAO(path=self.resources_dir)
         self.logger = logger
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    # GraphQL queries are read-only, so POST is safe to retry
+                    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                ),
+            ),
+        )
 
     def add_repo_2db(
         self,
@@ -70,40 +99,219 @@ class CliMembers:
 
     def update_badges(self):
         """Updates badges for projects."""
-        badges_folder_path = "{}/badges".format(self.current_dir)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for project, changed in executor.map(self._fetch_badge, self.dao.get_all()):
+                if changed:
+                    self.logger.info("Badge for %s has been updated.", project.name)
+                else:
+                    self.logger.info("Badge for %s is unchanged.", project.name)
 
-        for project in self.dao.get_all():
-            color = "blueviolet"
-            label = project.name
-            message = "Qiskit ecosystem"
-            url = (
-                f"https://img.shields.io/static/v1?"
-                f"label={label}&message={message}&color={color}"
-            )
+    def _fetch_badge(self, project: Repository) -> Tuple[Repository, bool]:
+        """Downloads the badge SVG for a project into the badges folder.
+
+        The badge is streamed to a temporary file, which only replaces the
+        existing badge if its content is different. This keeps unchanged
+        badges untouched on disk and in git.
+
+        Returns:
+            The project and whether its badge was changed (a failed download
+            leaves the existing badge untouched)
+        """
+        badge_path = Path(self.current_dir, "badges", f"{project.name}.svg")
+        color = "blueviolet"
+        label = project.name
+        message = "Qiskit ecosystem"
+        url = (
+            f"https://img.shields.io/static/v1?"
+            f"label={label}&message={message}&color={color}"
+        )
+
+        digest = hashlib.blake2b(digest_size=16)
+        with self.session.get(url, stream=True) as shields_request:
+            if not shields_request.ok:
+                self.logger.warning("Bad response for badge of %s", project.name)
+                return project, False
+            with tempfile.NamedTemporaryFile(
+                dir=badge_path.parent, suffix=".tmp", delete=False
+            ) as outfile:
+                try:
+                    for chunk in shields_request.iter_content(chunk_size=64 * 1024):
+                        digest.update(chunk)
+                        outfile.write(chunk)
+                except BaseException:
+                    os.unlink(outfile.name)
+                    raise
 
-            shields_request = requests.get(url)
-            with open(f"{badges_folder_path}/{project.name}.svg", "wb") as outfile:
-                outfile.write(shields_request.content)
-                self.logger.info("Badge for %s has been updated.", project.name)
+        if (
+            badge_path.exists()
+            and hashlib.blake2b(badge_path.read_bytes(), digest_size=16).digest()
+            == digest.digest()
+        ):
+            os.unlink(outfile.name)
+            return project, False
+        # NamedTemporaryFile is created owner-only; badges are public files
+        os.chmod(outfile.name, 0o644)
+        os.replace(outfile.name, badge_path)
+        return project, True
 
     def update_stars(self):
-        """Updates start for repositories."""
-        for project in self.dao.get_all():
-            stars = None
-            url = project.url[:-1] if project.url[-1] == "/" else project.url
-            url_chunks = url.split("/")
-            repo = url_chunks[-1]
-            user = url_chunks[-2]
+        """Updates start for repositories.
+
+        Uses the GitHub GraphQL API to fetch star counts in batches when a
+        `GITHUB_TOKEN` is available, and falls back to one REST call per
+        repository otherwise.
+        """
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            updates = self._collect_stars_graphql(token)
+        else:
+            updates = self._collect_stars_rest()
+        if updates:
+            self.dao.update_many(updates)
+
+    def _collect_stars_rest(self) -> dict[str, dict]:
+        """Fetches stars with one REST API call per repository.
+
+        Returns:
+            { repo URL: { attribute name: new value } } for changed repos
+        """
+        etags_path = Path(self.current_dir, ETAGS_FILE)
+        etags = json.loads(etags_path.read_text()) if etags_path.exists() else {}
+        new_etags = dict(etags)
+        updates = {}
+        projects = self._github_projects()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for project, response in executor.map(
+                self._fetch_star, projects, [etags.get(p.url) for p in projects]
+            ):
+                if response.status_code == 304:
+                    self.logger.info("Star count for %s is unchanged", project.url)
+                    continue
+                if not response.ok:
+                    self.logger.warning("Bad response for project %s", project.url)
+                    continue
+
+                if "ETag" in response.headers:
+                    new_etags[project.url] = response.headers["ETag"]
+                json_data = response.json()
+                stars = json_data.get("stargazers_count")
+                if stars is None:
+                    self.logger.warning("No star count for %s", project.url)
+                    continue
+                if stars == project.stars:
+                    self.logger.info("Star count for %s is unchanged", project.url)
+                    continue
+                updates[project.url] = {"stars": stars}
+                self.logger.info("Updating star count for %s: %d", project.url, stars)
+
+        if new_etags != etags:
+            etags_path.write_text(json.dumps(new_etags, indent=2))
+        return updates
 
-            response = requests.get(f"http://api.github.com/repos/{user}/{repo}")
+    def _fetch_star(
+        self, project: Repository, etag: Optional[str] = None
+    ) -> Tuple[Repository, requests.Response]:
+        """Requests the REST API description of a project's repository.
+
+        Sends the ETag from the previous run, if any, so GitHub can answer
+        with an empty `304 Not Modified` when the repository is unchanged.
+        Unauthenticated 304s still count against the rate limit.
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self._request_with_backoff(
+            "GET", f"https://api.github.com/repos/{project.owner_repo}", headers=headers
+        )
+        return project, response
+
+    def _collect_stars_graphql(self, token: str) -> dict[str, dict]:
+        """Fetches stars with one GraphQL API call per batch of repositories.
+
+        Each repository gets an aliased `repository` block in the query, so a
+        batch costs a single request regardless of its size.
+
+        Returns:
+            { repo URL: { attribute name: new value } } for changed repos
+        """
+        updates = {}
+        projects = self._github_projects()
+        for start in range(0, len(projects), GRAPHQL_BATCH_SIZE):
+            batch = projects[start : start + GRAPHQL_BATCH_SIZE]
+            blocks = []
+            for index, project in enumerate(batch):
+                user, repo = project.github_owner_repo
+                blocks.append(
+                    f"r{index}: repository(owner: {json.dumps(user)}, "
+                    f"name: {json.dumps(repo)}) {{ stargazerCount }}"
+                )
+            query = "query { " + " ".join(blocks) + " }"
+
+            response = self._request_with_backoff(
+                "POST",
+                "https://api.github.com/graphql",
+                json={"query": query},
+                headers={"Authorization": f"bearer {token}"},
+            )
             if not response.ok:
-                self.logger.warning("Bad response for project %s", project.url)
+                self.logger.warning("Bad response for batch of %d projects", len(batch))
                 continue
 
-            json_data = json.loads(response.text)
-            stars = json_data.get("stargazers_count")
-            self.dao.update(project.url, stars=stars)
-            self.logger.info("Updating star count for %s: %d", project.url, stars)
+            data = response.json().get("data") or {}
+            for index, project in enumerate(batch):
+                repository = data.get(f"r{index}")
+                if repository is None:
+                    self.logger.warning("Bad response for project %s", project.url)
+                    continue
+                stars = repository.get("stargazerCount")
+                if stars is None:
+                    self.logger.warning("No star count for %s", project.url)
+                    continue
+                if stars == project.stars:
+                    self.logger.info("Star count for %s is unchanged", project.url)
+                    continue
+                updates[project.url] = {"stars": stars}
+                self.logger.info("Updating star count for %s: %d", project.url, stars)
+        return updates
+
+    def _github_projects(self) -> list[Repository]:
+        """Returns all projects whose URL points to a GitHub repository.
+
+        Projects with malformed URLs are logged and skipped, so one bad entry
+        does not stop the others from being updated.
+        """
+        projects = []
+        for project in self.dao.get_all():
+            try:
+                _ = project.github_owner_repo
+            except ValueError:
+                self.logger.warning("Bad GitHub URL for project %s", project.url)
+                continue
+            projects.append(project)
+        return projects
+
+    def _request_with_backoff(
+        self, method: str, url: str, **kwargs
+    ) -> requests.Response:
+        """Sends a GitHub API request, waiting out the rate limit if exhausted.
+
+        Transient errors and responses with `Retry-After` are retried by the
+        session's adapter. The primary rate limit is reported as a 403 or 429
+        with `X-RateLimit-Remaining: 0` and no `Retry-After`, so we sleep until
+        `X-RateLimit-Reset` ourselves.
+        """
+        for attempt in range(RATE_LIMIT_ATTEMPTS):
+            response = self.session.request(method, url, **kwargs)
+            if (
+                response.status_code not in (403, 429)
+                or response.headers.get("X-RateLimit-Remaining") != "0"
+                or attempt == RATE_LIMIT_ATTEMPTS - 1
+            ):
+                break
+            response.close()
+            reset = int(response.headers.get("X-RateLimit-Reset", 0))
+            delay = max(reset - time.time(), 0) + 1
+            self.logger.warning("GitHub rate limit exceeded, waiting %ds", delay)
+            time.sleep(delay)
+        return response
 
     def compile_json(self, output_file: str):
         """Compile JSON file for consumption by ibm.com"""
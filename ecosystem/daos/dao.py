@@ -9,6 +9,7 @@ File structure:
 """
 from __future__ import annotations
 from pathlib import Path
+import copy
 import shutil
 import toml
 
@@ -31,20 +32,37 @@ class TomlStorage:
     def __init__(self, root_path: str):
         self.toml_dir = Path(root_path, "members")
         self._data = None  # for use with context manager
+        # Parsed TOML files: { path: ((mtime, size), dict) }
+        self._cache = {}
 
     def _url_to_path(self, url):
         repo_name = url.strip("/").split("/")[-1]
         return self.toml_dir / f"{repo_name}.toml"
 
+    @staticmethod
+    def _stat_key(path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
     def read(self) -> dict:
         """
         Search for TOML files and read into dict with types:
         { url (str): repo (Repository) }
+
+        Files are only parsed again if they changed since the last read or
+        write; every call still returns fresh Repository objects.
         """
         data = {}
+        cache = {}
         for path in self.toml_dir.glob("*.toml"):
-            repo = Repository.from_dict(toml.load(path))
+            key = self._stat_key(path)
+            entry = self._cache.get(path)
+            if entry is None or entry[0] != key:
+                entry = (key, toml.load(path))
+            cache[path] = entry
+            repo = Repository.from_dict(copy.deepcopy(entry[1]))
             data[repo.url] = repo
+        self._cache = cache
         return data
 
     def write(self, data: dict):
@@ -59,9 +77,14 @@ class TomlStorage:
 
         # Write to human-readable TOML
         self.toml_dir.mkdir()
+        cache = {}
         for repo in data.values():
-            with open(self._url_to_path(repo.url), "w") as file:
-                toml.dump(repo.to_dict(), file)
+            path = self._url_to_path(repo.url)
+            repo_dict = repo.to_dict()
+            with open(path, "w") as file:
+                toml.dump(repo_dict, file)
+            cache[path] = (self._stat_key(path), repo_dict)
+        self._cache = cache
 
     def __enter__(self) -> dict:
         self._data = self.read()
@@ -109,7 +132,7 @@ class DAO:
         if url not in data:
             logger.info("No repo with URL : %s", url)
             return None
-        return self.storage.read()[url]
+        return data[url]
 
     def get_all(self) -> list[Repository]:
         """
@@ -128,6 +151,19 @@ class DAO:
         Example usage:
             update("github.com/qiskit/qiskit, name="qiskit", stars=300)
         """
+        self.update_many({repo_url: kwargs})
+
+    def update_many(self, updates: dict[str, dict]):
+        """
+        Update attributes of several repositories, saving to disk only once.
+
+        Args:
+            updates: { repo URL (str): { attribute name: new value } }
+
+        Example usage:
+            update_many({"github.com/qiskit/qiskit": {"stars": 300}})
+        """
         with self.storage as data:
-            for arg, value in kwargs.items():
-                data[repo_url].__dict__[arg] = value
+            for repo_url, kwargs in updates.items():
+                for arg, value in kwargs.items():
+                    data[repo_url].__dict__[arg] = value
@@ -4,6 +4,7 @@ from __future__ import annotations
 import pprint
 from datetime import datetime
 from dataclasses import dataclass
+from urllib.parse import urlsplit
 from uuid import uuid4
 
 from .utils import JsonSerializable, new_list
@@ -42,6 +43,31 @@ class Repository(JsonSerializable):
         if self.uuid is None:
             self.uuid = str(uuid4())
 
+    @property
+    def github_owner_repo(self) -> tuple[str, str]:
+        """GitHub owner and name of the repository, e.g. ("Qiskit", "qiskit-aer").
+
+        Only the first two path segments are used, so links to a subfolder
+        (".../tree/main/some-package") and trailing slashes are handled. URLs
+        without a scheme ("github.com/Qiskit/qiskit-aer") are accepted too.
+
+        Raises:
+            ValueError: if the URL has no owner and name
+        """
+        split_url = urlsplit(self.url or "")
+        segments = split_url.path.strip("/").split("/")
+        if not split_url.netloc:
+            # Without a scheme, the host is parsed as part of the path
+            segments = segments[1:]
+        if len(segments) < 2 or not all(segments[:2]):
+            raise ValueError(f"No GitHub owner and name in URL {self.url}")
+        return segments[0], segments[1]
+
+    @property
+    def owner_repo(self) -> str:
+        """GitHub "owner/name" of the repository, e.g. "Qiskit/qiskit-aer"."""
+        return "/".join(self.github_owner_repo)
+
     @classmethod
     def from_dict(cls, dictionary: dict):
         """Transform dictionary to Repository.
@@ -1,31 +1,43 @@
 """Parser for issue submission."""
 
+from functools import lru_cache
 from pathlib import Path
-import mdformat
+import re
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 from ecosystem.models.repository import Repository
 
 
-def _parse_section(section: str, label_to_id: dict[str, str]) -> tuple[str, str]:
+# Matches a "### Field label" heading and the content up to the next heading
+_SECTION_RE = re.compile(r"^###[ \t]+([^\n]*)\n?(.*?)(?=^###[ \t]|\Z)", re.M | re.S)
+
+
+def _parse_section(
+    label: str, section: str, label_to_id: dict[str, str]
+) -> tuple[str, str]:
     """For a section, return its field ID and the content.
     The content has no newlines and has spaces stripped.
     """
-    lines = section.split("\n")
-    content = " ".join(line.strip() for line in lines[1:] if line)
-    label = lines[0].strip()
-    field_id = label_to_id[label]
+    content = " ".join(
+        line for line in (raw.strip() for raw in section.splitlines()) if line
+    )
+    field_id = label_to_id[label.strip()]
     return field_id, content
 
 
-def _get_label_to_id_map() -> dict[str, str]:
+@lru_cache(maxsize=1)
+def _get_label_to_id_map(
+    template_path: str = ".github/ISSUE_TEMPLATE/submission.yml",
+) -> dict[str, str]:
     """Create a dict that maps a fields "label" to its `id` from the issue
-    template
+    template. The template is only read and parsed once per process.
     """
-    issue_template = yaml.load(
-        Path(".github/ISSUE_TEMPLATE/submission.yml").read_text(),
-        Loader=yaml.SafeLoader,
-    )
+    issue_template = yaml.load(Path(template_path).read_text(), Loader=SafeLoader)
     label_to_id = {
         form["attributes"]["label"]: form["id"]
         for form in issue_template["body"]
@@ -65,15 +77,13 @@ def parse_submission_issue(body_of_issue: str) -> Repository:
     Return: Repository
     """
 
-    issue_formatted = mdformat.text(body_of_issue)
-
-    md_sections = issue_formatted.split("### ")[1:]
     label_to_id = _get_label_to_id_map()
-    args = dict(_parse_section(s, label_to_id) for s in md_sections)
-
     args = {
         field_id: (None if content == "_No response_" else content)
-        for field_id, content in args.items()
+        for field_id, content in (
+            _parse_section(*match.groups(), label_to_id)
+            for match in _SECTION_RE.finditer(body_of_issue)
+        )
     }
 
     if args["labels"] is None:
@@ -81,6 +91,6 @@ def parse_submission_issue(body_of_issue: str) -> Repository:
     else:
         args["labels"] = [x.strip() for x in args["labels"].split(",")]
 
-    args["ibm_maintained"] = args["ibm_maintained"].startswith("- \\[X\\]")
+    args["ibm_maintained"] = args["ibm_maintained"].startswith("- [X]")
 
     return Repository(**args)
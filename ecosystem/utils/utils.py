@@ -36,13 +36,16 @@ def set_actions_output(outputs: List[Tuple[str, Union[str, bool, float, int]]])
             - first element - name of output
             - second element - value of output
     """
+    lines = []
     for name, value in outputs:
         logger.info("Setting output variable %s: %s", name, value)
         if value is not None:
             assert "\n" not in value, f"Error: Newlines in github output ({value})"
-        if "CI" in os.environ:
-            with open(os.environ["GITHUB_OUTPUT"], "a") as github_env:
-                github_env.write(f"{name}={value}\n")
-        else:
-            # Used only during unit tests
-            print(f"{name}={value}")
+        lines.append(f"{name}={value}\n")
+
+    if "CI" in os.environ:
+        with open(os.environ["GITHUB_OUTPUT"], "a") as github_env:
+            github_env.write("".join(lines))
+    else:
+        # Used only during unit tests
+        print("".join(lines), end="")
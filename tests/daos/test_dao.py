@@ -2,7 +2,9 @@
 import tempfile
 import shutil
 from pathlib import Path
-from unittest import TestCase
+from unittest import TestCase, mock
+
+import toml
 
 from ecosystem.daos import DAO
 from ecosystem.models.repository import Repository
@@ -43,6 +45,22 @@ class TestDao(TestCase):
         repo_from_db = dao.get_by_url(main_repo.url)
         self.assertEqual(repo_from_db.stars, 42)
 
+    def test_update_many(self):
+        """Test updating several repos writes to disk once."""
+        main_repo = get_main_repo()
+        other_repo = Repository(name="other", url="https://github.com/Mock/other")
+        dao = DAO(self.path)
+        dao.write(main_repo)
+        dao.write(other_repo)
+
+        with mock.patch.object(
+            dao.storage, "write", wraps=dao.storage.write
+        ) as storage_write:
+            dao.update_many({main_repo.url: {"stars": 1}, other_repo.url: {"stars": 2}})
+        self.assertEqual(storage_write.call_count, 1)
+        self.assertEqual(dao.get_by_url(main_repo.url).stars, 1)
+        self.assertEqual(dao.get_by_url(other_repo.url).stars, 2)
+
     def test_repository_insert_and_delete(self):
         """Tests repository."""
         main_repo = get_main_repo()
@@ -56,3 +74,21 @@ class TestDao(TestCase):
         # delete entry
         dao.delete(repo_url=main_repo.url)
         self.assertEqual(len(dao.get_all()), 0)
+
+    def test_read_is_cached(self):
+        """Tests unchanged TOML files are only parsed once."""
+        main_repo = get_main_repo()
+        dao = DAO(self.path)
+        dao.write(main_repo)
+
+        with mock.patch("toml.load", wraps=toml.load) as toml_load:
+            dao.get_all()
+            dao.get_by_url(main_repo.url).labels.append("mutated")
+            fetched_repo = dao.get_by_url(main_repo.url)
+            self.assertEqual(toml_load.call_count, 0)
+            self.assertEqual(fetched_repo.labels, main_repo.labels)
+
+            repo_file = next((self.path / "members").glob("*.toml"))
+            repo_file.write_text(repo_file.read_text() + "stars = 7\n")
+            self.assertEqual(dao.get_by_url(main_repo.url).stars, 7)
+            self.assertEqual(toml_load.call_count, 1)
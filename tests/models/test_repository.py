@@ -29,3 +29,19 @@ class TestRepository(unittest.TestCase):
             main_repo.stars,
             recovered.stars,
         )
+
+    def test_owner_repo(self):
+        """Tests extracting the GitHub owner and name from the URL."""
+        for url in (
+            "https://github.com/Qiskit/qiskit-aer",
+            "https://github.com/Qiskit/qiskit-aer/",
+            "https://github.com/Qiskit/qiskit-aer/tree/main/subfolder",
+            "github.com/Qiskit/qiskit-aer",
+        ):
+            repo = Repository(url=url)
+            self.assertEqual(repo.github_owner_repo, ("Qiskit", "qiskit-aer"))
+            self.assertEqual(repo.owner_repo, "Qiskit/qiskit-aer")
+
+        for url in ("https://github.com/Qiskit", "github.com/Qiskit", ""):
+            with self.assertRaises(ValueError):
+                _ = Repository(url=url).github_owner_repo
@@ -1,13 +1,18 @@
 """Tests for cli."""
 import io
+import json
 import os
+import re
 import shutil
 import tempfile
-from unittest import TestCase
+from unittest import TestCase, mock
 from contextlib import redirect_stdout
 from pathlib import Path
 
+import responses
+
 from ecosystem.cli import CliCI, CliMembers
+from ecosystem.cli.members import RATE_LIMIT_ATTEMPTS
 from ecosystem.daos import DAO
 from ecosystem.models.repository import Repository
 
@@ -52,10 +57,12 @@ class TestCli(TestCase):
             issue_body
         """
 
+        cli_ci = CliCI(resources_dir=self.path)
+
         # Issue 1
         captured_output = io.StringIO()
         with redirect_stdout(captured_output):
-            CliCI.add_member_from_issue(self.issue_body, resources_dir=self.path)
+            cli_ci.add_member_from_issue(self.issue_body)
 
         output_value = captured_output.getvalue().split("\n")
         self.assertEqual(output_value[0], "SUBMISSION_NAME=My awesome project")
@@ -80,7 +87,7 @@ class TestCli(TestCase):
         # Issue 2
         captured_output = io.StringIO()
         with redirect_stdout(captured_output):
-            CliCI.add_member_from_issue(self.issue_body_2, resources_dir=self.path)
+            cli_ci.add_member_from_issue(self.issue_body_2)
 
         output_value = captured_output.getvalue().split("\n")
         self.assertEqual(output_value[0], "SUBMISSION_NAME=My awesome project")
@@ -129,3 +136,232 @@ class TestCli(TestCase):
         self.assertTrue('fill="blueviolet"' in svg_success)
 
         os.remove(f"{badges_folder_path}/{commu_success.name}.svg")
+
+    @responses.activate
+    def test_update_stars_graphql(self):
+        """Tests updating stars through the GraphQL API."""
+        repo = get_community_repo()
+        dao = DAO(self.path)
+        dao.write(repo)
+        responses.add(
+            responses.POST,
+            "https://api.github.com/graphql",
+            json={"data": {"r0": {"stargazerCount": 42}}},
+        )
+
+        cli_members = CliMembers(root_path=self.current_dir)
+        cli_members.dao = dao
+        with mock.patch.dict(os.environ, {"GITHUB_TOKEN": "token"}):
+            cli_members.update_stars()
+
+        self.assertEqual(len(responses.calls), 1)
+        self.assertIn(
+            'repository(owner: "MockQiskit", name: "mock-qiskit-wsdt.terra")',
+            json.loads(responses.calls[0].request.body)["query"],
+        )
+        self.assertEqual(dao.get_by_url(repo.url).stars, 42)
+
+    @responses.activate
+    def test_update_stars_bad_url(self):
+        """Tests a malformed URL only skips that project."""
+        repo = get_community_repo()
+        dao = DAO(self.path)
+        dao.write(repo)
+        dao.write(Repository(name="broken", url="https://github.com/broken"))
+        responses.add(
+            responses.POST,
+            "https://api.github.com/graphql",
+            json={"data": {"r0": {"stargazerCount": 42}}},
+        )
+
+        cli_members = CliMembers(root_path=self.path)
+        cli_members.dao = dao
+        with mock.patch.dict(os.environ, {"GITHUB_TOKEN": "token"}):
+            cli_members.update_stars()
+
+        self.assertEqual(dao.get_by_url(repo.url).stars, 42)
+        self.assertIsNone(dao.get_by_url("https://github.com/broken").stars)
+
+    @responses.activate
+    def test_update_stars_unchanged(self):
+        """Tests nothing is written when no star count changed."""
+        repo = get_community_repo()
+        repo.stars = 42
+        dao = DAO(self.path)
+        dao.write(repo)
+        responses.add(
+            responses.POST,
+            "https://api.github.com/graphql",
+            json={"data": {"r0": {"stargazerCount": 42}}},
+        )
+
+        cli_members = CliMembers(root_path=self.current_dir)
+        cli_members.dao = dao
+        with mock.patch.dict(os.environ, {"GITHUB_TOKEN": "token"}), mock.patch.object(
+            dao.storage, "write"
+        ) as storage_write:
+            cli_members.update_stars()
+
+        storage_write.assert_not_called()
+
+    @responses.activate
+    def test_update_stars_rest_etag(self):
+        """Tests updating stars through the REST API with conditional requests."""
+        repo = get_community_repo()
+        dao = DAO(self.path)
+        dao.write(repo)
+        api_url = "https://api.github.com/repos/MockQiskit/mock-qiskit-wsdt.terra"
+        responses.add(
+            responses.GET,
+            api_url,
+            json={"stargazers_count": 42},
+            headers={"ETag": '"abc"'},
+        )
+        responses.add(responses.GET, api_url, status=304)
+        responses.add(
+            responses.GET,
+            api_url,
+            json={"stargazers_count": 42},
+            headers={"ETag": '"def"'},
+        )
+
+        cli_members = CliMembers(root_path=self.path)
+        cli_members.dao = dao
+        with mock.patch.dict(os.environ, clear=True):
+            cli_members.update_stars()
+            cli_members.update_stars()
+            with mock.patch.object(dao.storage, "write") as storage_write:
+                cli_members.update_stars()
+
+        self.assertNotIn("If-None-Match", responses.calls[0].request.headers)
+        self.assertEqual(responses.calls[1].request.headers["If-None-Match"], '"abc"')
+        self.assertEqual(responses.calls[2].request.headers["If-None-Match"], '"abc"')
+        # A new ETag alone is saved to the cache file, not to the member data
+        storage_write.assert_not_called()
+        self.assertEqual(
+            json.loads((self.path / ".etags.json").read_text()), {repo.url: '"def"'}
+        )
+        retrieved = dao.get_by_url(repo.url)
+        self.assertEqual(retrieved.stars, 42)
+        self.assertNotIn("etag", retrieved.to_dict())
+
+    @responses.activate
+    def test_update_stars_missing_count(self):
+        """Tests repos without a star count are left untouched."""
+        repo = get_community_repo()
+        dao = DAO(self.path)
+        dao.write(repo)
+        responses.add(
+            responses.GET,
+            "https://api.github.com/repos/MockQiskit/mock-qiskit-wsdt.terra",
+            json={},
+        )
+
+        cli_members = CliMembers(root_path=self.current_dir)
+        cli_members.dao = dao
+        with mock.patch.dict(os.environ, clear=True), mock.patch.object(
+            dao.storage, "write"
+        ) as storage_write:
+            cli_members.update_stars()
+
+        storage_write.assert_not_called()
+        self.assertIsNone(dao.get_by_url(repo.url).stars)
+
+    @responses.activate
+    def test_update_stars_rate_limit_exhausted(self):
+        """Tests we give up without a final wait if every attempt is rate limited."""
+        repo = get_community_repo()
+        dao = DAO(self.path)
+        dao.write(repo)
+        responses.add(
+            responses.GET,
+            "https://api.github.com/repos/MockQiskit/mock-qiskit-wsdt.terra",
+            status=403,
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"},
+        )
+
+        cli_members = CliMembers(root_path=self.path)
+        cli_members.dao = dao
+        with mock.patch.dict(os.environ, clear=True), mock.patch("time.sleep") as sleep:
+            cli_members.update_stars()
+
+        self.assertEqual(len(responses.calls), RATE_LIMIT_ATTEMPTS)
+        self.assertEqual(sleep.call_count, RATE_LIMIT_ATTEMPTS - 1)
+        self.assertIsNone(dao.get_by_url(repo.url).stars)
+
+    @responses.activate
+    def test_update_stars_rate_limit(self):
+        """Tests waiting for the rate limit to reset before retrying."""
+        repo = get_community_repo()
+        dao = DAO(self.path)
+        dao.write(repo)
+        api_url = "https://api.github.com/repos/MockQiskit/mock-qiskit-wsdt.terra"
+        responses.add(
+            responses.GET,
+            api_url,
+            status=403,
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"},
+        )
+        responses.add(responses.GET, api_url, json={"stargazers_count": 42})
+
+        cli_members = CliMembers(root_path=self.current_dir)
+        cli_members.dao = dao
+        with mock.patch.dict(os.environ, clear=True), mock.patch("time.sleep") as sleep:
+            cli_members.update_stars()
+
+        sleep.assert_called_once()
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(dao.get_by_url(repo.url).stars, 42)
+
+    @responses.activate
+    def test_update_badges_unchanged(self):
+        """Tests badges are only rewritten when their content changes."""
+        repo = get_community_repo()
+        dao = DAO(self.path)
+        dao.write(repo)
+        (self.path / "badges").mkdir()
+        badge_path = self.path / "badges" / f"{repo.name}.svg"
+        for svg in (b"<svg>1</svg>", b"<svg>1</svg>", b"<svg>2</svg>"):
+            responses.add(
+                responses.GET,
+                re.compile(r"https://img\.shields\.io/.*"),
+                body=svg,
+                stream=True,
+            )
+
+        cli_members = CliMembers(root_path=self.path)
+        cli_members.dao = dao
+        with mock.patch("os.replace", wraps=os.replace) as replace:
+            cli_members.update_badges()
+            self.assertEqual(badge_path.read_bytes(), b"<svg>1</svg>")
+            cli_members.update_badges()
+            self.assertEqual(replace.call_count, 1)
+            cli_members.update_badges()
+            self.assertEqual(replace.call_count, 2)
+
+        self.assertEqual(badge_path.read_bytes(), b"<svg>2</svg>")
+        self.assertEqual(os.listdir(self.path / "badges"), [badge_path.name])
+
+    @responses.activate
+    def test_update_badges_bad_response(self):
+        """Tests an error response does not replace an existing badge."""
+        repo = get_community_repo()
+        dao = DAO(self.path)
+        dao.write(repo)
+        (self.path / "badges").mkdir()
+        badge_path = self.path / "badges" / f"{repo.name}.svg"
+        badge_path.write_bytes(b"<svg>1</svg>")
+        responses.add(
+            responses.GET,
+            re.compile(r"https://img\.shields\.io/.*"),
+            body=b"Not found",
+            status=404,
+            stream=True,
+        )
+
+        cli_members = CliMembers(root_path=self.path)
+        cli_members.dao = dao
+        cli_members.update_badges()
+
+        self.assertEqual(badge_path.read_bytes(), b"<svg>1</svg>")
+        self.assertEqual(os.listdir(self.path / "badges"), [badge_path.name])
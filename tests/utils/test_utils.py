@@ -47,6 +47,14 @@ class TestUtils(TestCase):
             parsed_result.labels, ["tool", "tutorial", "paper implementation"]
         )
 
+    def test_issue_parsing_crlf(self):
+        """Tests issue bodies with Windows line endings parse the same way."""
+        parsed_result = parse_submission_issue(self.issue_body.replace("\n", "\r\n"))
+        self.assertEqual(
+            parsed_result.to_dict() | {"uuid": None},
+            parse_submission_issue(self.issue_body).to_dict() | {"uuid": None},
+        )
+
     def test_issue_template_matches_repository_model(self):
         """Make sure IDs in the issue template match attributes of the Repository model."""
         issue_template = yaml.load(